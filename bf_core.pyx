@@ -0,0 +1,125 @@
+# cython: language_level=3
+"""
+Native execution loop for the Brainfuck interpreter.
+
+Build it in place with `python setup.py build_ext --inplace` (or install the
+project with pip); brainfuck-interpreter.py picks it up automatically when
+bf_core can be imported and falls back to Numba or pure Python otherwise.
+"""
+
+cimport cython
+
+# Mirrors BYTECODE_CACHE_VERSION in brainfuck-interpreter.py, which refuses to
+# use this extension when the two differ.
+BYTECODE_VERSION = 5
+
+# Mirrors the OP_* constants in brainfuck-interpreter.py.
+cdef enum:
+    OP_ADD        = 0
+    OP_NEXT       = 1
+    OP_PREVIOUS   = 2
+    OP_OUTPUT     = 3
+    OP_INPUT      = 4
+    OP_JZ         = 5
+    OP_JNZ        = 6
+    OP_CLEAR      = 7
+    OP_MULADD     = 8
+    OP_BREAK      = 9
+    OP_ADD_AT     = 10
+    OP_SCAN_RIGHT = 11
+    OP_SCAN_LEFT  = 12
+    OP_MOVE       = 13
+
+# Mirrors the _NATIVE_* status codes in brainfuck-interpreter.py.
+cdef enum:
+    NATIVE_DONE     = 0
+    NATIVE_COLD     = 1
+    NATIVE_OVERRUN  = 2
+    NATIVE_UNDERRUN = 3
+    NATIVE_YIELD    = 4
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef tuple run(const signed char[::1] ops, const int[::1] args, const long long[::1] mul_ranges,
+                const long long[::1] mul_offsets, const long long[::1] mul_multipliers,
+                unsigned char[::1] tape, Py_ssize_t ti, Py_ssize_t pc, Py_ssize_t stop,
+                Py_ssize_t budget):
+    """
+    Runs bytecode natively until pc reaches stop, it fails, or it reaches a cold opcode.
+    
+    After budget taken loop back-edges it returns NATIVE_YIELD instead, with
+    pc at the start of the loop body, so the caller can handle signals and
+    should_stop before resuming.
+    
+    Returns:
+        Tuple[int, int, int, int]: The program counter, the tape index, a
+        status code and, for an overrun, the attempted index.
+    """
+    cdef Py_ssize_t tape_size = tape.shape[0]
+    cdef Py_ssize_t k, j, target
+    cdef long long value
+    cdef signed char op
+
+    while pc < stop:
+        op = ops[pc]
+        if op == OP_ADD:
+            tape[ti] = <unsigned char>((tape[ti] + args[pc]) & 0xFF)
+        elif op == OP_ADD_AT:
+            k = args[pc] * 4
+            if ti + mul_ranges[k + 1] >= tape_size:
+                return pc, ti, NATIVE_OVERRUN, ti + mul_ranges[k + 1]
+            if ti + mul_ranges[k] < 0:
+                return pc, ti, NATIVE_UNDERRUN, 0
+            for j in range(mul_ranges[k + 2], mul_ranges[k + 3]):
+                target = ti + mul_offsets[j]
+                tape[target] = <unsigned char>((tape[target] + mul_multipliers[j]) & 0xFF)
+        elif op == OP_MOVE:
+            ti += args[pc]
+        elif op == OP_NEXT:
+            if ti + args[pc] >= tape_size:
+                return pc, ti, NATIVE_OVERRUN, ti + args[pc]
+            ti += args[pc]
+        elif op == OP_PREVIOUS:
+            if ti - args[pc] < 0:
+                return pc, ti, NATIVE_UNDERRUN, 0
+            ti -= args[pc]
+        elif op == OP_JZ:
+            if tape[ti] == 0:
+                pc = args[pc]
+                continue
+        elif op == OP_JNZ:
+            if tape[ti] != 0:
+                pc = args[pc]
+                budget -= 1
+                if budget == 0:
+                    return pc, ti, NATIVE_YIELD, 0
+                continue
+        elif op == OP_CLEAR:
+            tape[ti] = 0
+        elif op == OP_SCAN_RIGHT:
+            while tape[ti] != 0:
+                if ti + 1 >= tape_size:
+                    return pc, ti, NATIVE_OVERRUN, ti + 1
+                ti += 1
+        elif op == OP_SCAN_LEFT:
+            while tape[ti] != 0:
+                if ti == 0:
+                    return pc, ti, NATIVE_UNDERRUN, 0
+                ti -= 1
+        elif op == OP_MULADD:
+            value = tape[ti]
+            if value != 0:
+                k = args[pc] * 4
+                if ti + mul_ranges[k + 1] >= tape_size:
+                    return pc, ti, NATIVE_OVERRUN, ti + mul_ranges[k + 1]
+                if ti + mul_ranges[k] < 0:
+                    return pc, ti, NATIVE_UNDERRUN, 0
+                for j in range(mul_ranges[k + 2], mul_ranges[k + 3]):
+                    target = ti + mul_offsets[j]
+                    tape[target] = <unsigned char>((tape[target] + value * mul_multipliers[j]) & 0xFF)
+                tape[ti] = 0
+        else:
+            return pc, ti, NATIVE_COLD, 0
+        pc += 1
+    return pc, ti, NATIVE_DONE, 0
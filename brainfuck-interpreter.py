@@ -9,9 +9,24 @@ License: MIT
 
 import sys
 import os
+import re
 import argparse
+import functools
+import importlib.util
 import logging
-from typing import List, Tuple, Optional
+import marshal
+import warnings
+from collections import defaultdict
+from array import array
+from typing import Callable, DefaultDict, Dict, List, Tuple, Optional, Union
+
+# Optional native backends: the bf_core Cython extension, else Numba. Both are
+# validated in the Native Execution section; numba is only imported once a
+# loop turns hot.
+try:
+    import bf_core
+except ImportError:
+    bf_core = None
 
 # -----------------------------------------------------------------------------
 # Module Metadata and Configuration
@@ -26,6 +41,14 @@ logging.basicConfig(level=logging.ERROR, format='%(levelname)s: %(message)s')
 # -----------------------------------------------------------------------------
 TAPE_SIZE = 30000
 
+# Buffered program output is written out once it grows past this many bytes.
+OUTPUT_FLUSH_THRESHOLD = 64 * 1024
+
+# Iterations after which a loop is handed to the Numba kernel (see brainfuck_execute).
+HOT_THRESHOLD = 1000
+
+# Source tokens. TOKEN_MINUS only appears in source code: the parser turns
+# every '+'/'-' run into a TOKEN_PLUS, so the passes after it never see one.
 TOKEN_PLUS       = '+'
 TOKEN_MINUS      = '-'
 TOKEN_NEXT       = '>'
@@ -36,6 +59,39 @@ TOKEN_LOOP_START = '['
 TOKEN_LOOP_END   = ']'
 TOKEN_BREAK      = '#'
 
+# Synthetic tokens emitted by the parser for recognized loop idioms.
+TOKEN_CLEAR      = 'Z'
+TOKEN_MULADD     = 'M'
+TOKEN_ADD_AT     = 'A'
+TOKEN_SCAN_RIGHT = 'R'
+TOKEN_SCAN_LEFT  = 'L'
+TOKEN_MOVE       = 'P'
+
+# Matches one run of a repeated token (or a single loop/break marker) and
+# skips every other character, so comments never reach the parser loop.
+_TOKEN_RE = re.compile(r'\++|-+|>+|<+|\.+|,+|[\[\]#]')
+
+# Integer opcodes of the flat bytecode produced by compile_to_bytecode.
+OP_ADD        = 0
+OP_NEXT       = 1
+OP_PREVIOUS   = 2
+OP_OUTPUT     = 3
+OP_INPUT      = 4
+OP_JZ         = 5
+OP_JNZ        = 6
+OP_CLEAR      = 7
+OP_MULADD     = 8
+OP_BREAK      = 9
+OP_ADD_AT     = 10
+OP_SCAN_RIGHT = 11
+OP_SCAN_LEFT  = 12
+OP_MOVE       = 13
+
+# Every opcode compile_to_bytecode can emit; cached bytecode may use no others.
+_KNOWN_OPCODES = frozenset((OP_ADD, OP_NEXT, OP_PREVIOUS, OP_OUTPUT, OP_INPUT, OP_JZ, OP_JNZ,
+                            OP_CLEAR, OP_MULADD, OP_BREAK, OP_ADD_AT, OP_SCAN_RIGHT,
+                            OP_SCAN_LEFT, OP_MOVE))
+
 # -----------------------------------------------------------------------------
 # Custom Exceptions
 # -----------------------------------------------------------------------------
@@ -57,16 +113,20 @@ class BrainfuckInstruction:
     Attributes:
         token (str): The Brainfuck token (e.g. '+', '-', etc.).
         difference (int): The net effect of consecutive same tokens.
-        loop (Optional[List[BrainfuckInstruction]]): For loops, the list of instructions inside.
+        loop (Optional[Union[List[BrainfuckInstruction], Dict[int, int]]]): For loops, the
+            list of instructions inside; for TOKEN_MULADD, a mapping of tape offsets to multipliers;
+            for TOKEN_ADD_AT, a mapping of tape offsets to the deltas added there.
     """
+    __slots__ = ('token', 'difference', 'loop')
+
     def __init__(self, token: str, difference: int = 1,
-                 loop: Optional[List['BrainfuckInstruction']] = None) -> None:
+                 loop: Optional[Union[List['BrainfuckInstruction'], Dict[int, int]]] = None) -> None:
         self.token = token
         self.difference = difference
         self.loop = loop
 
     def __repr__(self) -> str:
-        if self.token == TOKEN_LOOP_START:
+        if self.token in (TOKEN_LOOP_START, TOKEN_MULADD, TOKEN_ADD_AT):
             return f"Instr({self.token}, diff={self.difference}, loop={self.loop})"
         return f"Instr({self.token}, diff={self.difference})"
 
@@ -75,28 +135,69 @@ class BrainfuckExecutionContext:
     Holds the execution context for a Brainfuck program.
     
     Attributes:
-        tape (List[int]): The memory tape.
+        tape (bytearray): The memory tape, one unsigned byte per cell.
         tape_index (int): The current index on the tape.
         tape_size (int): Total size of the tape.
         should_stop (bool): Flag to stop execution.
-        output_handler (callable): Function to handle output.
-        input_handler (callable): Function to handle input.
+        out_buf (bytearray): Output bytes not yet written to stdout.
+        output_handler (callable): Function to handle output; buffers into out_buf by default.
+        interactive_input (bool): True if stdin is a terminal.
+        input_buf (Optional[bytes]): All of stdin, read on the first ',' when not interactive.
+        input_pos (int): Index of the next unread byte in input_buf.
+        input_handler (callable): Function to handle input; line-based for a
+            terminal, reading from input_buf otherwise.
     """
     def __init__(self, tape_size: int) -> None:
-        self.tape = [0] * tape_size
+        self.tape = bytearray(tape_size)
         self.tape_index = 0
         self.tape_size = tape_size
         self.should_stop = False
-        self.output_handler = lambda x: sys.stdout.write(chr(x))
-        self.input_handler = brainfuck_getchar
+        self.out_buf = bytearray()
+        self.output_handler = self.out_buf.append
+        self.interactive_input = sys.stdin is not None and sys.stdin.isatty()
+        self.input_buf: Optional[bytes] = None
+        self.input_pos = 0
+        if self.interactive_input:
+            self.input_handler = brainfuck_getchar
+        else:
+            self.input_handler = functools.partial(brainfuck_read_buffered, self)
+
+# Opcodes, their arguments, and the (low, high, ((offset, multiplier), ...))
+# entries that OP_MULADD and OP_ADD_AT arguments index into; for OP_ADD_AT
+# the multipliers are the deltas to add.
+BrainfuckBytecode = Tuple[array, array, List[Tuple[int, int, Tuple[Tuple[int, int], ...]]]]
 
 # -----------------------------------------------------------------------------
 # I/O Utility
 # -----------------------------------------------------------------------------
+def flush_output(context: 'BrainfuckExecutionContext') -> None:
+    """
+    Writes any buffered program output to stdout as raw bytes.
+    
+    Text already printed through sys.stdout is flushed first so that tape
+    dumps, prompts and program output keep their order.
+    
+    Args:
+        context (BrainfuckExecutionContext): The execution context.
+    """
+    if not context.out_buf:
+        return
+    sys.stdout.flush()
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is not None:
+        stream.write(context.out_buf)
+        stream.flush()
+    else:
+        sys.stdout.write(context.out_buf.decode('latin-1'))
+        sys.stdout.flush()
+    context.out_buf.clear()
+
 def brainfuck_getchar() -> str:
     """
     Reads exactly one character from stdin and discards the rest of the line.
     
+    Only used when stdin is a terminal, where each ',' prompts for a line.
+    
     Returns:
         str: The character read.
     """
@@ -107,75 +208,214 @@ def brainfuck_getchar() -> str:
             break
     return ch
 
+def brainfuck_read_buffered(context: 'BrainfuckExecutionContext') -> str:
+    """
+    Returns the next byte of non-interactive stdin.
+    
+    The whole of stdin is read into context.input_buf on the first call and
+    then consumed one byte per ','. Every byte is kept, newlines included.
+    
+    Args:
+        context (BrainfuckExecutionContext): The execution context.
+    
+    Returns:
+        str: The byte read, as a one-character string, or '' at EOF.
+    """
+    if context.input_buf is None:
+        stream = getattr(sys.stdin, 'buffer', None)
+        if stream is not None:
+            context.input_buf = stream.read()
+        else:
+            context.input_buf = sys.stdin.read().encode('latin-1') if sys.stdin is not None else b''
+    if context.input_pos >= len(context.input_buf):
+        return ''
+    ch = chr(context.input_buf[context.input_pos])
+    context.input_pos += 1
+    return ch
+
 # -----------------------------------------------------------------------------
 # Parsing Functions
 # -----------------------------------------------------------------------------
-def parse_brainfuck(code: str, index: int = 0, end: Optional[int] = None,
-                    inside_loop: bool = False) -> Tuple[List[BrainfuckInstruction], int]:
+def parse_brainfuck(code: str) -> List[BrainfuckInstruction]:
     """
-    Recursively parses Brainfuck code into a list of instructions.
+    Parses Brainfuck code into a list of instructions.
     
-    Consecutive tokens (e.g. '+' or '>') are merged by computing a "difference".
-    If inside a loop (inside_loop=True), the function stops when a matching ']' is found.
+    The code is first split by _TOKEN_RE into runs of identical tokens, which
+    also drops every comment character. Adjacent '+'/'-' runs (and '>'/'<' runs)
+    are then merged by computing a "difference"; '+'/'-' runs become a single
+    '+' whose difference is the net change reduced to 0..255.
+    Loops are tracked with an explicit stack of open instruction lists rather
+    than recursion, so nesting depth is not limited by the Python stack. When
+    a loop closes, its body is checked for the clear, scan and multiply idioms
+    and otherwise run through coalesce_straight_line and dead_loop_elim.
     
     Args:
         code (str): The Brainfuck code.
-        index (int): Starting index.
-        end (Optional[int]): Ending index; if None, uses len(code).
-        inside_loop (bool): True if parsing inside a loop.
     
     Returns:
-        Tuple[List[BrainfuckInstruction], int]: Parsed instructions and new index.
+        List[BrainfuckInstruction]: The parsed (top-level, not yet coalesced) instructions.
     
     Raises:
         BrainfuckParseError: If an unmatched loop marker is detected.
     """
-    if end is None:
-        end = len(code)
-    instructions: List[BrainfuckInstruction] = []
+    tokens = _TOKEN_RE.findall(code)
+    end = len(tokens)
+    stack: List[List[BrainfuckInstruction]] = [[]]
+    instructions = stack[0]
+    index = 0
     while index < end:
-        c = code[index]
+        tok = tokens[index]
         index += 1
-        if c not in (TOKEN_PLUS, TOKEN_MINUS, TOKEN_NEXT, TOKEN_PREVIOUS,
-                     TOKEN_OUTPUT, TOKEN_INPUT, TOKEN_LOOP_START, TOKEN_LOOP_END, TOKEN_BREAK):
-            continue
+        c = tok[0]
         if c == TOKEN_LOOP_START:
-            loop_instructions, index = parse_brainfuck(code, index, end, inside_loop=True)
-            instructions.append(BrainfuckInstruction(TOKEN_LOOP_START, 1, loop_instructions))
+            instructions = []
+            stack.append(instructions)
         elif c == TOKEN_LOOP_END:
-            if not inside_loop:
-                raise BrainfuckParseError("Unexpected ']' encountered at position {}".format(index-1))
-            return instructions, index
+            if len(stack) == 1:
+                raise BrainfuckParseError("Unexpected ']' encountered at position {}".format(
+                    _unmatched_loop_end_position(code)))
+            loop_instructions = stack.pop()
+            instructions = stack[-1]
+            multipliers = analyze_loop(loop_instructions)
+            scan = _scan_direction(loop_instructions)
+            if _is_clear_loop(loop_instructions):
+                instructions.append(BrainfuckInstruction(TOKEN_CLEAR, 1))
+            elif scan != 0:
+                instructions.append(BrainfuckInstruction(TOKEN_SCAN_RIGHT if scan > 0 else TOKEN_SCAN_LEFT, 1))
+            elif multipliers is not None:
+                instructions.append(BrainfuckInstruction(TOKEN_MULADD, 1, multipliers))
+            else:
+                instructions.append(BrainfuckInstruction(TOKEN_LOOP_START, 1,
+                                                         dead_loop_elim(coalesce_straight_line(loop_instructions))))
         elif c in (TOKEN_PLUS, TOKEN_MINUS):
-            diff = 1
-            while index < end and code[index] in (TOKEN_PLUS, TOKEN_MINUS):
-                diff = diff + 1 if code[index] == c else diff - 1
+            diff = len(tok)
+            while index < end and tokens[index][0] in (TOKEN_PLUS, TOKEN_MINUS):
+                diff = diff + len(tokens[index]) if tokens[index][0] == c else diff - len(tokens[index])
                 index += 1
-            instructions.append(BrainfuckInstruction(c, diff))
+            if c == TOKEN_MINUS:
+                diff = -diff
+            instructions.append(BrainfuckInstruction(TOKEN_PLUS, diff & 0xFF))
         elif c in (TOKEN_NEXT, TOKEN_PREVIOUS):
-            diff = 1
-            while index < end and code[index] in (TOKEN_NEXT, TOKEN_PREVIOUS):
-                diff = diff + 1 if code[index] == c else diff - 1
+            diff = len(tok)
+            while index < end and tokens[index][0] in (TOKEN_NEXT, TOKEN_PREVIOUS):
+                diff = diff + len(tokens[index]) if tokens[index][0] == c else diff - len(tokens[index])
                 index += 1
             instructions.append(BrainfuckInstruction(c, diff))
         elif c in (TOKEN_OUTPUT, TOKEN_INPUT):
-            diff = 1
-            while index < end and code[index] == c:
-                diff += 1
-                index += 1
-            instructions.append(BrainfuckInstruction(c, diff))
+            instructions.append(BrainfuckInstruction(c, len(tok)))
         elif c == TOKEN_BREAK:
             instructions.append(BrainfuckInstruction(c, 1))
-    if inside_loop:
+    if len(stack) != 1:
         raise BrainfuckParseError("Unmatched '[' detected")
-    return instructions, index
+    return instructions
+
+def _is_clear_loop(loop_instructions: List[BrainfuckInstruction]) -> bool:
+    """
+    Checks whether a loop body is a clear idiom such as '[-]' or '[+]'.
+    
+    A body made of a single '+' with an odd difference (the parser stores '-'
+    runs as '+' too) always reaches zero, so the whole loop can be replaced by
+    setting the cell to zero.
+    
+    Args:
+        loop_instructions (List[BrainfuckInstruction]): The parsed loop body.
+    
+    Returns:
+        bool: True if the loop only clears the current cell.
+    """
+    return (len(loop_instructions) == 1
+            and loop_instructions[0].token == TOKEN_PLUS
+            and loop_instructions[0].difference % 2 == 1)
+
+def _scan_direction(loop_instructions: List[BrainfuckInstruction]) -> int:
+    """
+    Checks whether a loop body is a scan idiom such as '[>]' or '[<]'.
+    
+    Only single-cell steps are recognized; wider strides stay ordinary loops.
+    
+    Args:
+        loop_instructions (List[BrainfuckInstruction]): The parsed loop body.
+    
+    Returns:
+        int: 1 for a scan to the right, -1 for a scan to the left, 0 otherwise.
+    """
+    if len(loop_instructions) != 1 or loop_instructions[0].token not in (TOKEN_NEXT, TOKEN_PREVIOUS):
+        return 0
+    step = loop_instructions[0].difference
+    if loop_instructions[0].token == TOKEN_PREVIOUS:
+        step = -step
+    return step if step in (1, -1) else 0
 
-def parse_string(code: str) -> List[BrainfuckInstruction]:
+def analyze_loop(loop_instructions: List[BrainfuckInstruction]) -> Optional[Dict[int, int]]:
+    """
+    Recognizes copy/multiply loops such as '[->+<]' or '[->++>+<<]'.
+    
+    The body is simulated symbolically. It qualifies when it only contains
+    '+', '-', '>' and '<', returns the pointer to where it started and
+    decrements the starting cell by exactly one per iteration. Every other
+    cell it touches then receives the starting value times its net delta.
+    
+    Args:
+        loop_instructions (List[BrainfuckInstruction]): The parsed loop body.
+    
+    Returns:
+        Optional[Dict[int, int]]: Offsets mapped to multipliers, or None if the
+        loop does not match. The lowest and highest offsets the pointer visits
+        are always present (with multiplier 0 if nothing is added there), so
+        the executor can bounds-check the loop exactly like the original moves.
+    """
+    pointer = 0
+    low = high = 0
+    deltas: Dict[int, int] = {}
+    for instr in loop_instructions:
+        if instr.token == TOKEN_PLUS:
+            deltas[pointer] = deltas.get(pointer, 0) + instr.difference
+        elif instr.token == TOKEN_NEXT:
+            pointer += instr.difference
+        elif instr.token == TOKEN_PREVIOUS:
+            pointer -= instr.difference
+        else:
+            return None
+        low = min(low, pointer)
+        high = max(high, pointer)
+    if pointer != 0 or deltas.pop(0, 0) & 0xFF != 0xFF:
+        return None
+    multipliers = {offset: delta & 0xFF for offset, delta in deltas.items() if delta & 0xFF}
+    for offset in (low, high):
+        if offset != 0:
+            multipliers.setdefault(offset, 0)
+    return multipliers
+
+def _unmatched_loop_end_position(code: str) -> int:
+    """
+    Finds the position of the first ']' in the code that has no matching '['.
+    
+    Only used to build error messages, so it scans the raw string.
+    
+    Args:
+        code (str): The Brainfuck code.
+    
+    Returns:
+        int: The position of the unmatched ']', or -1 if there is none.
+    """
+    depth = 0
+    for position, c in enumerate(code):
+        if c == TOKEN_LOOP_START:
+            depth += 1
+        elif c == TOKEN_LOOP_END:
+            depth -= 1
+            if depth < 0:
+                return position
+    return -1
+
+def parse_string(code: str, fresh_tape: bool = True) -> List[BrainfuckInstruction]:
     """
     Parses an entire Brainfuck code string into a list of instructions.
     
     Args:
         code (str): The Brainfuck code.
+        fresh_tape (bool): True if the code will run on an all-zero tape, which
+            lets loops at the very start of the program be dropped.
     
     Returns:
         List[BrainfuckInstruction]: The parsed instructions.
@@ -183,82 +423,767 @@ def parse_string(code: str) -> List[BrainfuckInstruction]:
     Raises:
         BrainfuckParseError: If parsing fails.
     """
-    instructions, _ = parse_brainfuck(code)
-    return instructions
+    return dead_loop_elim(coalesce_straight_line(parse_brainfuck(code)), fresh_tape)
+
+def coalesce_straight_line(instructions: List[BrainfuckInstruction]) -> List[BrainfuckInstruction]:
+    """
+    Rewrites runs of '+', '-', '>' and '<' into offset-indexed additions.
+    
+    Each maximal run is simulated to find the net delta of every cell it
+    touches and where the pointer ends up. It is replaced by one TOKEN_ADD_AT
+    holding every changed cell, followed by a single TOKEN_MOVE. The lowest
+    and highest offsets the pointer visits are kept in the mapping (with
+    delta 0 if nothing is added there), so the executor checks the whole run
+    against the tape once and then touches cells and moves unchecked; a run
+    that fails the check applies none of its additions. A run that only
+    changes the current cell and moves straight to its target becomes a
+    plain '+' and a checked '>' or '<' instead. Loop bodies are left alone;
+    the parser coalesces each one as its loop closes.
+    
+    Args:
+        instructions (List[BrainfuckInstruction]): The parsed instructions.
+    
+    Returns:
+        List[BrainfuckInstruction]: The rewritten instructions.
+    """
+    coalesced: List[BrainfuckInstruction] = []
+    index = 0
+    end = len(instructions)
+    while index < end:
+        instr = instructions[index]
+        if instr.token not in (TOKEN_PLUS, TOKEN_NEXT, TOKEN_PREVIOUS):
+            coalesced.append(instr)
+            index += 1
+            continue
+
+        pointer = 0
+        low = high = 0
+        deltas: DefaultDict[int, int] = defaultdict(int)
+        while index < end and instructions[index].token in (TOKEN_PLUS, TOKEN_NEXT, TOKEN_PREVIOUS):
+            instr = instructions[index]
+            if instr.token == TOKEN_PLUS:
+                deltas[pointer] += instr.difference
+            elif instr.token == TOKEN_NEXT:
+                pointer += instr.difference
+            else:
+                pointer -= instr.difference
+            low = min(low, pointer)
+            high = max(high, pointer)
+            index += 1
+
+        changes = {offset: delta & 0xFF for offset, delta in sorted(deltas.items()) if delta & 0xFF}
+        overshoots = (low, high) != (min(0, pointer), max(0, pointer))
+        touches_other_cells = any(offset != 0 for offset in changes)
+        if overshoots or touches_other_cells:
+            for offset in (low, high):
+                changes.setdefault(offset, 0)
+            coalesced.append(BrainfuckInstruction(TOKEN_ADD_AT, 1, changes))
+            if pointer != 0:
+                coalesced.append(BrainfuckInstruction(TOKEN_MOVE, pointer))
+            continue
+        if changes:
+            coalesced.append(BrainfuckInstruction(TOKEN_PLUS, changes[0]))
+        if pointer > 0:
+            coalesced.append(BrainfuckInstruction(TOKEN_NEXT, pointer))
+        elif pointer < 0:
+            coalesced.append(BrainfuckInstruction(TOKEN_PREVIOUS, -pointer))
+    return coalesced
+
+def dead_loop_elim(instructions: List[BrainfuckInstruction],
+                   cell_known_zero: bool = False) -> List[BrainfuckInstruction]:
+    """
+    Drops loops that can never run because the current cell is known to be zero.
+    
+    Every loop, and every instruction derived from one (clear, scan and
+    multiply), leaves the current cell at zero, so a loop right after it is
+    dead; with cell_known_zero the same holds at the start of the list. The
+    fact survives output, '#' and additions to other cells, and is lost on
+    anything that may change the current cell or move the pointer. Loop
+    bodies are left alone; the parser handles each one as its loop closes.
+    
+    Args:
+        instructions (List[BrainfuckInstruction]): Coalesced instructions.
+        cell_known_zero (bool): True if the current cell is zero on entry.
+    
+    Returns:
+        List[BrainfuckInstruction]: The instructions without dead loops.
+    """
+    live: List[BrainfuckInstruction] = []
+    for instr in instructions:
+        if instr.token in (TOKEN_LOOP_START, TOKEN_CLEAR, TOKEN_MULADD, TOKEN_SCAN_RIGHT, TOKEN_SCAN_LEFT):
+            if not cell_known_zero:
+                live.append(instr)
+            cell_known_zero = True
+            continue
+        live.append(instr)
+        if instr.token == TOKEN_ADD_AT and not instr.loop.get(0):
+            continue
+        if instr.token not in (TOKEN_OUTPUT, TOKEN_BREAK):
+            cell_known_zero = False
+    return live
+
+# -----------------------------------------------------------------------------
+# Compilation Functions
+# -----------------------------------------------------------------------------
+def compile_to_bytecode(instructions: List[BrainfuckInstruction]) -> BrainfuckBytecode:
+    """
+    Lowers a parsed instruction tree into flat bytecode.
+    
+    Loops become an OP_JZ/OP_JNZ pair carrying absolute jump targets: OP_JZ
+    jumps past the matching OP_JNZ, and OP_JNZ jumps back to the first
+    instruction of the body. '+', which the parser already reduced to
+    0..255, becomes OP_ADD. OP_ADD_AT indexes an aux entry like OP_MULADD, with
+    the deltas in place of the multipliers. OP_MOVE keeps its signed,
+    unchecked distance; other pointer moves are normalized so that the
+    argument is always a positive distance.
+    
+    Args:
+        instructions (List[BrainfuckInstruction]): The parsed instructions.
+    
+    Returns:
+        BrainfuckBytecode: The opcodes, their arguments and the auxiliary data
+        referenced by OP_MULADD and OP_ADD_AT.
+    """
+    ops = array('b')
+    args = array('i')
+    aux: List[Tuple[int, int, Tuple[Tuple[int, int], ...]]] = []
+
+    # Each entry is an instruction list being emitted, the position reached in
+    # it, and the index of the OP_JZ that opened it (-1 for the top level).
+    pending: List[Tuple[List[BrainfuckInstruction], int, int]] = [(instructions, 0, -1)]
+    while pending:
+        body, position, start = pending.pop()
+        if position == len(body):
+            if start >= 0:
+                ops.append(OP_JNZ)
+                args.append(start + 1)
+                args[start] = len(ops)
+            continue
+        instr = body[position]
+        pending.append((body, position + 1, start))
+        token = instr.token
+        diff = instr.difference
+        if token == TOKEN_PLUS:
+            ops.append(OP_ADD)
+            args.append(diff)
+        elif token in (TOKEN_NEXT, TOKEN_PREVIOUS):
+            if diff == 0:
+                continue
+            if diff < 0:
+                token = TOKEN_PREVIOUS if token == TOKEN_NEXT else TOKEN_NEXT
+                diff = -diff
+            ops.append(OP_NEXT if token == TOKEN_NEXT else OP_PREVIOUS)
+            args.append(diff)
+        elif token == TOKEN_OUTPUT:
+            ops.append(OP_OUTPUT)
+            args.append(diff)
+        elif token == TOKEN_INPUT:
+            ops.append(OP_INPUT)
+            args.append(diff)
+        elif token == TOKEN_ADD_AT:
+            aux.append((min(instr.loop), max(instr.loop),
+                        tuple(item for item in instr.loop.items() if item[1])))
+            ops.append(OP_ADD_AT)
+            args.append(len(aux) - 1)
+        elif token == TOKEN_MOVE:
+            ops.append(OP_MOVE)
+            args.append(diff)
+        elif token == TOKEN_CLEAR:
+            ops.append(OP_CLEAR)
+            args.append(0)
+        elif token in (TOKEN_SCAN_RIGHT, TOKEN_SCAN_LEFT):
+            ops.append(OP_SCAN_RIGHT if token == TOKEN_SCAN_RIGHT else OP_SCAN_LEFT)
+            args.append(0)
+        elif token == TOKEN_MULADD:
+            aux.append((min(instr.loop, default=0), max(instr.loop, default=0),
+                        tuple(instr.loop.items())))
+            ops.append(OP_MULADD)
+            args.append(len(aux) - 1)
+        elif token == TOKEN_LOOP_START:
+            pending.append((instr.loop, 0, len(ops)))
+            ops.append(OP_JZ)
+            args.append(0)
+        elif token == TOKEN_BREAK:
+            ops.append(OP_BREAK)
+            args.append(0)
+    return ops, args, aux
+
+# -----------------------------------------------------------------------------
+# Bytecode Caching
+# -----------------------------------------------------------------------------
+# Bump whenever the opcode set or the output of compile_to_bytecode changes,
+# so stale on-disk caches are ignored. BYTECODE_VERSION in bf_core.pyx must be
+# bumped with it.
+BYTECODE_CACHE_VERSION = 5
+
+@functools.lru_cache(maxsize=128)
+def compile_cached(code: str, fresh_tape: bool = True) -> BrainfuckBytecode:
+    """
+    Parses and compiles Brainfuck code, reusing the result for repeated input.
+    
+    The returned bytecode is shared between callers and must not be modified.
+    
+    Args:
+        code (str): The Brainfuck code.
+        fresh_tape (bool): True if the code will run on an all-zero tape.
+    
+    Returns:
+        BrainfuckBytecode: The compiled program.
+    
+    Raises:
+        BrainfuckParseError: If parsing fails.
+    """
+    return compile_to_bytecode(parse_string(code, fresh_tape))
+
+def _bytecode_cache_path(filename: str) -> str:
+    """Returns where the compiled form of a .bf file is cached, next to it in __pycache__."""
+    directory, name = os.path.split(os.path.abspath(filename))
+    return os.path.join(directory, "__pycache__", name + "c")
+
+def load_cached_bytecode(filename: str, stat: os.stat_result) -> Optional[BrainfuckBytecode]:
+    """
+    Loads the cached bytecode of a Brainfuck file if it is still up to date.
+    
+    Like a .pyc file, the cache records the cache version and the source's
+    modification time and size; any mismatch or unreadable cache is a miss.
+    The bytecode itself is checked by _valid_bytecode before it is returned,
+    since bf_core runs it without bounds checks.
+    
+    Args:
+        filename (str): Path to the Brainfuck file.
+        stat (os.stat_result): The current status of that file.
+    
+    Returns:
+        Optional[BrainfuckBytecode]: The cached program, or None on a miss.
+    """
+    try:
+        with open(_bytecode_cache_path(filename), 'rb') as f:
+            version, mtime, size, ops_bytes, args_bytes, aux = marshal.load(f)
+        if (version, mtime, size) != (BYTECODE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size):
+            return None
+        ops = array('b')
+        args = array('i')
+        ops.frombytes(ops_bytes)
+        args.frombytes(args_bytes)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not _valid_bytecode((ops, args, aux)):
+        return None
+    return ops, args, aux
+
+def _valid_bytecode(bytecode: BrainfuckBytecode) -> bool:
+    """
+    Checks that bytecode has the shape compile_to_bytecode produces.
+    
+    Every opcode must be known, jump targets must stay inside the program,
+    every aux index must exist, and aux offsets must lie within their
+    entry's (low, high) range. OP_MOVE is unchecked, so it must directly
+    follow an OP_ADD_AT that covers its distance, and no jump may land on it.
+    
+    Args:
+        bytecode (BrainfuckBytecode): The program to check.
+    
+    Returns:
+        bool: True if the bytecode is safe to execute.
+    """
+    ops, args, aux = bytecode
+    n = len(ops)
+    if len(args) != n or not isinstance(aux, list):
+        return False
+    for entry in aux:
+        if not (isinstance(entry, tuple) and len(entry) == 3):
+            return False
+        low, high, items = entry
+        if not (isinstance(low, int) and isinstance(high, int) and isinstance(items, tuple)):
+            return False
+        for item in items:
+            if not (isinstance(item, tuple) and len(item) == 2
+                    and all(isinstance(value, int) for value in item) and low <= item[0] <= high):
+                return False
+    for pc in range(n):
+        op = ops[pc]
+        arg = args[pc]
+        if op not in _KNOWN_OPCODES:
+            return False
+        if op in (OP_JZ, OP_JNZ):
+            if not 0 <= arg <= n or (arg < n and ops[arg] == OP_MOVE):
+                return False
+        elif op in (OP_MULADD, OP_ADD_AT):
+            if not 0 <= arg < len(aux):
+                return False
+        elif op == OP_MOVE:
+            if pc == 0 or ops[pc - 1] != OP_ADD_AT:
+                return False
+            low, high, _ = aux[args[pc - 1]]
+            if not low <= arg <= high:
+                return False
+    return True
+
+def store_cached_bytecode(filename: str, stat: os.stat_result, bytecode: BrainfuckBytecode) -> None:
+    """
+    Writes the bytecode of a Brainfuck file to its cache, ignoring failures.
+    
+    The cache is written to a temporary file next to it and then renamed into
+    place, so a concurrent reader never sees a partially written cache. Like
+    .pyc files, nothing is written under -B or PYTHONDONTWRITEBYTECODE.
+    
+    Args:
+        filename (str): Path to the Brainfuck file.
+        stat (os.stat_result): The status of the file the bytecode was compiled from.
+        bytecode (BrainfuckBytecode): The compiled program.
+    """
+    if sys.dont_write_bytecode:
+        return
+    ops, args, aux = bytecode
+    path = _bytecode_cache_path(filename)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            marshal.dump((BYTECODE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size,
+                          ops.tobytes(), args.tobytes(), aux), f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logging.debug(f"Could not write bytecode cache {path}: {e}")
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
 
 # -----------------------------------------------------------------------------
 # Execution Functions
 # -----------------------------------------------------------------------------
-def execute_instruction(instr: BrainfuckInstruction, context: BrainfuckExecutionContext) -> None:
+def handle_output(context: BrainfuckExecutionContext, diff: int) -> None:
     """
-    Executes a single Brainfuck instruction using the provided context.
+    Writes the current cell to the output handler diff times.
+    
+    Buffered output is flushed once it exceeds OUTPUT_FLUSH_THRESHOLD, so
+    long-running programs keep producing output and memory stays bounded.
     
     Args:
-        instr (BrainfuckInstruction): The instruction to execute.
         context (BrainfuckExecutionContext): The execution context.
+        diff (int): Number of consecutive '.' tokens.
+    """
+    value = context.tape[context.tape_index]
+    for _ in range(diff):
+        context.output_handler(value)
+    if len(context.out_buf) >= OUTPUT_FLUSH_THRESHOLD:
+        flush_output(context)
+
+def handle_input(context: BrainfuckExecutionContext, diff: int) -> None:
+    """
+    Reads diff characters from the input handler into the current cell.
     
-    Raises:
-        BrainfuckRuntimeError: On tape pointer errors.
+    When reading from a terminal, buffered output is flushed first so prompts
+    appear before input is read.
+    
+    Args:
+        context (BrainfuckExecutionContext): The execution context.
+        diff (int): Number of consecutive ',' tokens.
+    """
+    if context.interactive_input:
+        flush_output(context)
+    for _ in range(diff):
+        ch = context.input_handler()
+        context.tape[context.tape_index] = 0 if ch == '' else ord(ch) & 0xFF
+
+def handle_break(context: BrainfuckExecutionContext, diff: int) -> None:
     """
-    token = instr.token
-    diff = instr.difference
+    Prints the cells around the tape pointer.
+    
+    Args:
+        context (BrainfuckExecutionContext): The execution context.
+        diff (int): Unused.
+    """
+    flush_output(context)
+    low = max(0, context.tape_index - 10)
+    high = min(context.tape_size, low + 21)
+    print(_indices_line(low, high))
+    print("\t".join(map(str, context.tape[low:high])))
+    print(_pointer_line(low, high, context.tape_index))
 
-    if token == TOKEN_PLUS:
-        context.tape[context.tape_index] = (context.tape[context.tape_index] + diff) % 256
+@functools.lru_cache(maxsize=128)
+def _indices_line(low: int, high: int) -> str:
+    """Returns the tab-separated cell indices of a '#' window."""
+    return "\t".join(str(i) for i in range(low, high))
 
-    elif token == TOKEN_MINUS:
-        context.tape[context.tape_index] = (context.tape[context.tape_index] - diff) % 256
+@functools.lru_cache(maxsize=None)
+def _blank_pointer_line(width: int) -> str:
+    """Returns the marker line of a '#' window of width cells with no '^' in it."""
+    return "\t".join(" " * width)
 
-    elif token == TOKEN_NEXT:
-        new_index = context.tape_index + diff
-        if new_index >= context.tape_size:
-            raise BrainfuckRuntimeError(f"Tape overrun: attempted index {new_index}, tape size is {context.tape_size}")
-        context.tape_index = new_index
+def _pointer_line(low: int, high: int, tape_index: int) -> str:
+    """Returns the '^' marker line of a '#' window."""
+    line = _blank_pointer_line(high - low)
+    if not low <= tape_index < high:
+        return line
+    column = 2 * (tape_index - low)
+    return line[:column] + "^" + line[column + 1:]
 
-    elif token == TOKEN_PREVIOUS:
-        new_index = context.tape_index - diff
-        if new_index < 0:
-            raise BrainfuckRuntimeError("Tape underrun: negative tape index")
-        context.tape_index = new_index
+# Handlers for the opcodes that are rare in hot loops. brainfuck_execute
+# inlines every other opcode and only looks these up once its if-chain misses.
+COLD_HANDLERS: Dict[int, Callable[[BrainfuckExecutionContext, int], None]] = {
+    OP_OUTPUT: handle_output,
+    OP_INPUT: handle_input,
+    OP_BREAK: handle_break,
+}
 
-    elif token == TOKEN_OUTPUT:
-        for _ in range(diff):
-            context.output_handler(context.tape[context.tape_index])
-        sys.stdout.flush()
+# -----------------------------------------------------------------------------
+# Native Execution (optional, requires the bf_core extension or numba)
+# -----------------------------------------------------------------------------
+# Status codes returned by _run_native.
+_NATIVE_DONE     = 0
+_NATIVE_COLD     = 1
+_NATIVE_OVERRUN  = 2
+_NATIVE_UNDERRUN = 3
+_NATIVE_YIELD    = 4
 
-    elif token == TOKEN_INPUT:
-        for _ in range(diff):
-            ch = context.input_handler()
-            context.tape[context.tape_index] = 0 if ch == '' else ord(ch)
-
-    elif token == TOKEN_LOOP_START:
-        while context.tape[context.tape_index] != 0:
-            brainfuck_execute(instr.loop, context)
-
-    elif token == TOKEN_BREAK:
-        low = max(0, context.tape_index - 10)
-        high = min(context.tape_size, low + 21)
-        indices = "\t".join(str(i) for i in range(low, high))
-        values = "\t".join(str(context.tape[i]) for i in range(low, high))
-        pointer_line = "\t".join("^" if i == context.tape_index else " " for i in range(low, high))
-        print(indices)
-        print(values)
-        print(pointer_line)
-    else:
-        pass
+# Loop back-edges the native loop takes before handing control back with
+# _NATIVE_YIELD, so that signal handlers and should_stop still get to run.
+NATIVE_YIELD_INTERVAL = 65536
 
-def brainfuck_execute(instructions: List[BrainfuckInstruction], context: BrainfuckExecutionContext) -> None:
+# A bf_core built from an older bf_core.pyx would run mismatched opcodes with
+# bounds checks off, so it is only used if it speaks this bytecode version.
+if bf_core is not None and getattr(bf_core, 'BYTECODE_VERSION', None) != BYTECODE_CACHE_VERSION:
+    # warnings rather than logging, whose ERROR level would hide this.
+    warnings.warn(f"Ignoring bf_core built for bytecode version {getattr(bf_core, 'BYTECODE_VERSION', None)}, "
+                  f"expected {BYTECODE_CACHE_VERSION}; rebuild it with `python setup.py build_ext --inplace`",
+                  RuntimeWarning)
+    bf_core = None
+
+_numba_available = bf_core is None and importlib.util.find_spec("numba") is not None
+
+if bf_core is not None:
+    _run_native = bf_core.run
+    _native_view = memoryview
+else:
+    # Set by _load_numba_kernel once a loop turns hot.
+    _run_native = None
+    _native_view = None
+
+def _native_kernel(ops, args, mul_ranges, mul_offsets, mul_multipliers, tape, ti, pc, stop, budget):
     """
-    Executes a list of Brainfuck instructions using the provided context.
+    Runs bytecode natively until pc reaches stop, it fails, or it reaches a cold opcode.
+    
+    After budget taken loop back-edges it returns _NATIVE_YIELD instead, with
+    pc at the start of the loop body, exactly like bf_core.run.
+    
+    This is the source of the Numba kernel; _load_numba_kernel compiles it
+    with numba.njit, it is not meant to be called directly.
+    
+    Returns:
+        Tuple[int, int, int, int]: The program counter, the tape index, a
+        _NATIVE_* status code and, for _NATIVE_OVERRUN, the attempted index.
+    """
+    tape_size = tape.shape[0]
+    while pc < stop:
+        op = ops[pc]
+        if op == OP_ADD:
+            tape[ti] = (tape[ti] + args[pc]) & 0xFF
+        elif op == OP_ADD_AT:
+            k = args[pc] * 4
+            if ti + mul_ranges[k + 1] >= tape_size:
+                return pc, ti, _NATIVE_OVERRUN, ti + mul_ranges[k + 1]
+            if ti + mul_ranges[k] < 0:
+                return pc, ti, _NATIVE_UNDERRUN, 0
+            for j in range(mul_ranges[k + 2], mul_ranges[k + 3]):
+                target = ti + mul_offsets[j]
+                tape[target] = (tape[target] + mul_multipliers[j]) & 0xFF
+        elif op == OP_MOVE:
+            ti += args[pc]
+        elif op == OP_NEXT:
+            if ti + args[pc] >= tape_size:
+                return pc, ti, _NATIVE_OVERRUN, ti + args[pc]
+            ti += args[pc]
+        elif op == OP_PREVIOUS:
+            if ti - args[pc] < 0:
+                return pc, ti, _NATIVE_UNDERRUN, 0
+            ti -= args[pc]
+        elif op == OP_JZ:
+            if tape[ti] == 0:
+                pc = args[pc]
+                continue
+        elif op == OP_JNZ:
+            if tape[ti] != 0:
+                pc = args[pc]
+                budget -= 1
+                if budget == 0:
+                    return pc, ti, _NATIVE_YIELD, 0
+                continue
+        elif op == OP_CLEAR:
+            tape[ti] = 0
+        elif op == OP_SCAN_RIGHT:
+            while tape[ti] != 0:
+                if ti + 1 >= tape_size:
+                    return pc, ti, _NATIVE_OVERRUN, ti + 1
+                ti += 1
+        elif op == OP_SCAN_LEFT:
+            while tape[ti] != 0:
+                if ti == 0:
+                    return pc, ti, _NATIVE_UNDERRUN, 0
+                ti -= 1
+        elif op == OP_MULADD:
+            value = tape[ti]
+            if value != 0:
+                k = args[pc] * 4
+                if ti + mul_ranges[k + 1] >= tape_size:
+                    return pc, ti, _NATIVE_OVERRUN, ti + mul_ranges[k + 1]
+                if ti + mul_ranges[k] < 0:
+                    return pc, ti, _NATIVE_UNDERRUN, 0
+                for j in range(mul_ranges[k + 2], mul_ranges[k + 3]):
+                    target = ti + mul_offsets[j]
+                    tape[target] = (tape[target] + value * mul_multipliers[j]) & 0xFF
+                tape[ti] = 0
+        else:
+            return pc, ti, _NATIVE_COLD, 0
+        pc += 1
+    return pc, ti, _NATIVE_DONE, 0
+
+def _load_numba_kernel() -> None:
+    """
+    Imports numba and JIT-compiles _native_kernel into _run_native.
+    
+    Only called from brainfuck_execute when a loop first turns hot, so
+    programs that never get there skip importing numba and numpy.
+    
+    Raises:
+        Exception: If numba cannot be imported or the kernel fails to compile.
+    """
+    global _run_native, _native_view
+    import numpy as np
+    import numba
+    _run_native = numba.njit(cache=True)(_native_kernel)
+    _native_view = np.asarray
+
+def _disable_numba(error: Exception) -> None:
+    """
+    Stops using the Numba kernel for the rest of the process after it failed.
+    
+    Reported through warnings rather than logging, whose ERROR level would
+    hide it.
+    
+    Args:
+        error (Exception): Why importing or compiling the kernel failed.
+    """
+    global _numba_available
+    _numba_available = False
+    warnings.warn(f"Numba kernel unavailable, continuing interpreted: {error}", RuntimeWarning)
+
+def _native_buffers(bytecode: BrainfuckBytecode, context: BrainfuckExecutionContext) -> tuple:
+    """
+    Prepares the leading arguments of _run_native for a program and context.
+    
+    The native loop works on zero-copy views of the bytecode and of
+    context.tape, so both sides see the same cells. OP_MULADD and OP_ADD_AT
+    data is flattened into array('q') buffers, with four range entries
+    (low, high, start, end) per instruction.
     
     Args:
-        instructions (List[BrainfuckInstruction]): The instructions to execute.
+        bytecode (BrainfuckBytecode): The program, as returned by compile_to_bytecode.
         context (BrainfuckExecutionContext): The execution context.
+    
+    Returns:
+        tuple: The views to pass to _run_native before ti, pc and stop.
     """
-    for instr in instructions:
+    ops, args, aux = bytecode
+    mul_ranges = array('q')
+    mul_offsets = array('q')
+    mul_multipliers = array('q')
+    for low, high, items in aux:
+        mul_ranges.extend((low, high, len(mul_offsets), len(mul_offsets) + len(items)))
+        mul_offsets.extend(offset for offset, _ in items)
+        mul_multipliers.extend(multiplier for _, multiplier in items)
+    return (_native_view(ops), _native_view(args), _native_view(mul_ranges),
+            _native_view(mul_offsets), _native_view(mul_multipliers), _native_view(context.tape))
+
+def _raise_native_error(status: int, attempted: int, tape_size: int) -> None:
+    """
+    Raises the BrainfuckRuntimeError matching a failed _run_native status.
+    
+    Args:
+        status (int): _NATIVE_OVERRUN or _NATIVE_UNDERRUN.
+        attempted (int): The index an overrun tried to reach.
+        tape_size (int): Total size of the tape.
+    
+    Raises:
+        BrainfuckRuntimeError: Always.
+    """
+    if status == _NATIVE_OVERRUN:
+        raise BrainfuckRuntimeError(f"Tape overrun: attempted index {attempted}, tape size is {tape_size}")
+    raise BrainfuckRuntimeError("Tape underrun: negative tape index")
+
+def _execute_native(bytecode: BrainfuckBytecode, context: BrainfuckExecutionContext) -> None:
+    """
+    Executes a whole program with the native loop from bf_core.
+    
+    The native loop hands control back for every cold opcode, which then
+    runs through COLD_HANDLERS before the native loop resumes, and after
+    every NATIVE_YIELD_INTERVAL loop back-edges. should_stop is honoured,
+    and Python signal handlers such as KeyboardInterrupt run, at those
+    hand-offs.
+    
+    Args:
+        bytecode (BrainfuckBytecode): The program, as returned by compile_to_bytecode.
+        context (BrainfuckExecutionContext): The execution context.
+    
+    Raises:
+        BrainfuckRuntimeError: On tape pointer errors.
+    """
+    ops, args, _ = bytecode
+    buffers = _native_buffers(bytecode, context)
+    n = len(ops)
+    pc = 0
+    while True:
+        pc, ti, status, attempted = _run_native(*buffers, context.tape_index, pc, n,
+                                                NATIVE_YIELD_INTERVAL)
+        context.tape_index = ti
+        if status == _NATIVE_DONE:
+            return
+        if status == _NATIVE_YIELD:
+            if context.should_stop:
+                return
+            continue
+        if status != _NATIVE_COLD:
+            _raise_native_error(status, attempted, context.tape_size)
         if context.should_stop:
-            break
-        execute_instruction(instr, context)
+            return
+        COLD_HANDLERS[ops[pc]](context, args[pc])
+        pc += 1
+
+def brainfuck_execute(bytecode: BrainfuckBytecode, context: BrainfuckExecutionContext) -> None:
+    """
+    Executes compiled Brainfuck bytecode using the provided context.
+    
+    The whole program runs in a single dispatch loop; the tape pointer is
+    kept in a local variable and written back to the context when execution
+    ends, including when it ends with an error, and buffered output is
+    flushed at the same point. Hot opcodes are handled inline, most frequent
+    first; I/O and '#' go through COLD_HANDLERS. should_stop is only checked
+    on loop back-edges and after cold handlers; straight-line code between
+    them always runs to completion. Native code (bf_core, or a hot loop in
+    the Numba kernel) returns to Python after every cold opcode and every
+    NATIVE_YIELD_INTERVAL back-edges, where should_stop is checked and
+    signal handlers such as KeyboardInterrupt get to run.
+    
+    With the bf_core extension the whole program runs natively via
+    _execute_native. With numba, execution starts interpreted and a loop
+    whose back-edge is taken more than HOT_THRESHOLD times is handed to the
+    Numba kernel, which hands it back to the interpreter after at most
+    NATIVE_YIELD_INTERVAL back-edges, so short programs never import
+    numba or pay for JIT compilation. If importing or compiling it fails,
+    interpretation simply continues.
+    
+    Args:
+        bytecode (BrainfuckBytecode): The program, as returned by compile_to_bytecode.
+        context (BrainfuckExecutionContext): The execution context.
+    
+    Raises:
+        BrainfuckRuntimeError: On tape pointer errors.
+    """
+    if bf_core is not None:
+        try:
+            _execute_native(bytecode, context)
+        finally:
+            flush_output(context)
+        return
+    ops, args, aux = bytecode
+    tape = context.tape
+    tape_size = context.tape_size
+    ti = context.tape_index
+    cold_handlers = COLD_HANDLERS
+    pc = 0
+    n = len(ops)
+    # Back-edge counts per OP_JNZ, only kept while the Numba kernel is usable.
+    hot_counts = [0] * n if _numba_available else None
+    native_buffers = None
+    if context.should_stop:
+        return
+    try:
+        while pc < n:
+            op = ops[pc]
+            if op == OP_ADD:
+                tape[ti] = (tape[ti] + args[pc]) & 0xFF
+            elif op == OP_ADD_AT:
+                low, high, items = aux[args[pc]]
+                if ti + high >= tape_size:
+                    raise BrainfuckRuntimeError(f"Tape overrun: attempted index {ti + high}, tape size is {tape_size}")
+                if ti + low < 0:
+                    raise BrainfuckRuntimeError("Tape underrun: negative tape index")
+                for offset, delta in items:
+                    tape[ti + offset] = (tape[ti + offset] + delta) & 0xFF
+            elif op == OP_MOVE:
+                ti += args[pc]
+            elif op == OP_NEXT:
+                new_index = ti + args[pc]
+                if new_index >= tape_size:
+                    raise BrainfuckRuntimeError(f"Tape overrun: attempted index {new_index}, tape size is {tape_size}")
+                ti = new_index
+            elif op == OP_PREVIOUS:
+                if ti - args[pc] < 0:
+                    raise BrainfuckRuntimeError("Tape underrun: negative tape index")
+                ti -= args[pc]
+            elif op == OP_JZ:
+                if tape[ti] == 0:
+                    pc = args[pc]
+                    continue
+            elif op == OP_JNZ:
+                if tape[ti] != 0:
+                    if context.should_stop:
+                        break
+                    if hot_counts is not None:
+                        hot_counts[pc] += 1
+                        if hot_counts[pc] > HOT_THRESHOLD:
+                            try:
+                                if _run_native is None:
+                                    _load_numba_kernel()
+                                if native_buffers is None:
+                                    native_buffers = _native_buffers(bytecode, context)
+                                pc, ti, status, attempted = _run_native(*native_buffers, ti, args[pc], pc + 1,
+                                                                        NATIVE_YIELD_INTERVAL)
+                            except Exception as e:
+                                _disable_numba(e)
+                                hot_counts = None
+                                pc = args[pc]
+                                continue
+                            if status in (_NATIVE_OVERRUN, _NATIVE_UNDERRUN):
+                                _raise_native_error(status, attempted, tape_size)
+                            continue
+                    pc = args[pc]
+                    continue
+            elif op == OP_CLEAR:
+                tape[ti] = 0
+            elif op == OP_SCAN_RIGHT:
+                new_index = tape.find(0, ti)
+                if new_index < 0:
+                    ti = tape_size - 1
+                    raise BrainfuckRuntimeError(f"Tape overrun: attempted index {tape_size}, tape size is {tape_size}")
+                ti = new_index
+            elif op == OP_SCAN_LEFT:
+                new_index = tape.rfind(0, 0, ti + 1)
+                if new_index < 0:
+                    ti = 0
+                    raise BrainfuckRuntimeError("Tape underrun: negative tape index")
+                ti = new_index
+            elif op == OP_MULADD:
+                value = tape[ti]
+                if value != 0:
+                    low, high, items = aux[args[pc]]
+                    if ti + high >= tape_size:
+                        raise BrainfuckRuntimeError(f"Tape overrun: attempted index {ti + high}, tape size is {tape_size}")
+                    if ti + low < 0:
+                        raise BrainfuckRuntimeError("Tape underrun: negative tape index")
+                    for offset, multiplier in items:
+                        tape[ti + offset] = (tape[ti + offset] + value * multiplier) & 0xFF
+                    tape[ti] = 0
+            else:
+                context.tape_index = ti
+                cold_handlers[op](context, args[pc])
+                if context.should_stop:
+                    break
+            pc += 1
+    finally:
+        context.tape_index = ti
+        flush_output(context)
 
 # -----------------------------------------------------------------------------
 # Run Modes
@@ -267,6 +1192,9 @@ def run_file(filename: str) -> bool:
     """
     Reads Brainfuck code from a file and executes it.
     
+    The compiled bytecode is cached on disk and reused while the file's
+    modification time and size are unchanged.
+    
     Args:
         filename (str): Path to the Brainfuck file.
     
@@ -275,20 +1203,25 @@ def run_file(filename: str) -> bool:
     """
     try:
         with open(filename, 'r') as f:
-            code = f.read()
+            stat = os.fstat(f.fileno())
+            bytecode = load_cached_bytecode(filename, stat)
+            if bytecode is None:
+                code = f.read()
     except Exception as e:
         logging.error(f"Failed to read file {filename}: {e}")
         return False
 
-    try:
-        instructions = parse_string(code)
-    except BrainfuckParseError as e:
-        logging.error(f"Failed to parse code in file {filename}: {e}")
-        return False
+    if bytecode is None:
+        try:
+            bytecode = compile_cached(code)
+        except BrainfuckParseError as e:
+            logging.error(f"Failed to parse code in file {filename}: {e}")
+            return False
+        store_cached_bytecode(filename, stat, bytecode)
 
     context = BrainfuckExecutionContext(TAPE_SIZE)
     try:
-        brainfuck_execute(instructions, context)
+        brainfuck_execute(bytecode, context)
     except BrainfuckRuntimeError as e:
         logging.error(f"Runtime error in file {filename}: {e}")
         return False
@@ -306,14 +1239,14 @@ def run_code(code: str) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        instructions = parse_string(code)
+        bytecode = compile_cached(code)
     except BrainfuckParseError as e:
         logging.error(f"Failed to parse code: {e}")
         return False
 
     context = BrainfuckExecutionContext(TAPE_SIZE)
     try:
-        brainfuck_execute(instructions, context)
+        brainfuck_execute(bytecode, context)
     except BrainfuckRuntimeError as e:
         logging.error(f"Runtime error: {e}")
         return False
@@ -335,8 +1268,8 @@ def run_interactive_console() -> None:
         if not line.strip():
             continue
         try:
-            instructions = parse_string(line)
-            brainfuck_execute(instructions, context)
+            bytecode = compile_cached(line, fresh_tape=False)
+            brainfuck_execute(bytecode, context)
         except (BrainfuckParseError, BrainfuckRuntimeError) as e:
             logging.error(e)
         print()
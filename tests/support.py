@@ -0,0 +1,46 @@
+"""
+Shared setup for the tests: loads brainfuck-interpreter.py as a module.
+
+The script's file name is not a valid module name, so it is loaded from its
+path and registered in sys.modules like a normal import.
+"""
+
+import atexit
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+# Numba keys its on-disk cache by source file, and entries compiled here under
+# a test module name break later runs of the script as __main__, so the tests
+# keep their own cache. This must happen before numba is first imported.
+_numba_cache = tempfile.mkdtemp(prefix="bf-numba-cache-")
+atexit.register(shutil.rmtree, _numba_cache, ignore_errors=True)
+os.environ["NUMBA_CACHE_DIR"] = _numba_cache
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "brainfuck-interpreter.py")
+
+_spec = importlib.util.spec_from_file_location("brainfuck_interpreter", SCRIPT)
+bf = importlib.util.module_from_spec(_spec)
+# Numba cannot compile functions of a module missing from sys.modules.
+sys.modules[_spec.name] = bf
+_spec.loader.exec_module(bf)
+
+@contextlib.contextmanager
+def captured_stdout():
+    """
+    Replaces sys.stdout with a byte-backed stream for the duration of the block.
+
+    Yields:
+        io.BytesIO: Everything written to stdout, text and raw bytes alike,
+        once the block has exited.
+    """
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="latin-1", newline="")
+    with contextlib.redirect_stdout(stream):
+        yield raw
+    stream.flush()
+    stream.detach()
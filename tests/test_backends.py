@@ -0,0 +1,252 @@
+"""
+Differential tests for the Brainfuck interpreter backends.
+
+Every program is compiled with compile_cached and run by brainfuck_execute
+on each available backend (pure Python, Numba, the bf_core extension), and
+its output, final tape and success are compared with a naive reference
+interpreter that follows the Brainfuck semantics directly.
+
+Run with `python -m unittest discover tests` (or pytest).
+"""
+
+import contextlib
+import importlib.util
+import random
+import threading
+import unittest
+from unittest import mock
+
+from support import bf
+
+# Small enough that random programs regularly run off either end.
+TAPE_SIZE = 64
+
+# Programs whose reference run takes more steps than this are skipped.
+STEP_LIMIT = 20000
+
+# Seconds after which run() asks a program to stop, so a backend that loops
+# forever fails the test instead of hanging it.
+RUN_TIMEOUT = 5.0
+
+PROGRAMS = [
+    "",
+    "+++.",
+    "-.",
+    "++++++++[>++++++++<-]>+.",
+    "+++++[>+++[>++<-]<-]>>.",
+    "++++[>+++<-]>[<+>-]<.",
+    "+++[->++>+++>+<<<]>.>.>.",
+    "+[>+]",
+    ">>>+<<<[>]",
+    "+>+>+>[<]",
+    "[-]+++[-].",
+    "+++[]",
+    "[[[-]]]>+.",
+    ",[.,]",
+    ",>,<[->+<]>.",
+    "<",
+    ">" * TAPE_SIZE,
+    ">+<<",
+    "+[-<+]",
+    "+++++[->>>>>>>>>>+<<<<<<<<<<]",
+    "+++[>+>++>+++<<<-]>>>>>>>" + ">" * TAPE_SIZE + "<",
+    "++[>++[>++<-]<-]>>[>+>+<<-]>>.",
+    ">+.<+.>>-.",
+]
+
+INPUT = b"\x03\x07AZ"
+
+class TapeError(Exception):
+    """Raised by reference_run when the tape pointer leaves the tape."""
+
+class StepLimitExceeded(Exception):
+    """Raised by reference_run when a program runs longer than STEP_LIMIT."""
+
+def reference_run(code: str, data: bytes) -> tuple:
+    """
+    Runs code one character at a time on a TAPE_SIZE tape.
+
+    Like the interpreter, a run of '>' and '<' is bounds-checked on its net
+    move only, so '<>' at the start of the tape is fine.
+
+    Args:
+        code (str): The Brainfuck code.
+        data (bytes): The program input; reading past its end yields 0.
+
+    Returns:
+        tuple: The output bytes, the final tape and True, or the output so far,
+        None and False if the pointer left the tape.
+
+    Raises:
+        StepLimitExceeded: If the program runs for more than STEP_LIMIT steps.
+    """
+    jumps = {}
+    stack = []
+    for position, c in enumerate(code):
+        if c == "[":
+            stack.append(position)
+        elif c == "]":
+            start = stack.pop()
+            jumps[start] = position
+            jumps[position] = start
+    tape = bytearray(TAPE_SIZE)
+    output = bytearray()
+    ti = pc = read = steps = 0
+    try:
+        while pc < len(code):
+            steps += 1
+            if steps > STEP_LIMIT:
+                raise StepLimitExceeded()
+            c = code[pc]
+            if c == "+":
+                tape[ti] = (tape[ti] + 1) & 0xFF
+            elif c == "-":
+                tape[ti] = (tape[ti] - 1) & 0xFF
+            elif c in "><":
+                while pc < len(code) and code[pc] in "><":
+                    ti += 1 if code[pc] == ">" else -1
+                    pc += 1
+                if not 0 <= ti < TAPE_SIZE:
+                    raise TapeError()
+                continue
+            elif c == ".":
+                output.append(tape[ti])
+            elif c == ",":
+                tape[ti] = data[read] if read < len(data) else 0
+                read += 1
+            elif c == "[" and tape[ti] == 0:
+                pc = jumps[pc]
+            elif c == "]" and tape[ti] != 0:
+                pc = jumps[pc]
+            pc += 1
+    except TapeError:
+        return bytes(output), None, False
+    return bytes(output), bytes(tape), True
+
+def random_program(rng: random.Random, depth: int = 0) -> str:
+    """Builds a random balanced program, favouring the idioms the optimizer rewrites."""
+    pieces = []
+    for _ in range(rng.randint(1, 8)):
+        roll = rng.random()
+        if roll < 0.55:
+            pieces.append(rng.choice("+-<>.,") * rng.randint(1, 4))
+        elif roll < 0.75:
+            pieces.append(rng.choice(["[-]", "[+]", "[>]", "[<]", "[->+<]", "[-<+>]", "[->>++<<]", "[>+<-]"]))
+        elif depth < 3:
+            pieces.append("[" + random_program(rng, depth + 1) + "]")
+    return "".join(pieces)
+
+@contextlib.contextmanager
+def backend(name: str):
+    """Temporarily switches the interpreter module to one execution backend."""
+    saved = {attr: getattr(bf, attr) for attr in
+             ("bf_core", "_numba_available", "_run_native", "_native_view", "HOT_THRESHOLD")}
+    try:
+        if name == "python":
+            bf.bf_core = None
+            bf._numba_available = False
+        elif name == "numba":
+            bf.bf_core = None
+            bf._numba_available = True
+            bf._run_native = bf._native_view = None
+            # Hand every loop to the kernel after its first back-edge.
+            bf.HOT_THRESHOLD = 0
+        yield
+    finally:
+        for attr, value in saved.items():
+            setattr(bf, attr, value)
+
+def run(code: str, data: bytes, timeout: float = RUN_TIMEOUT) -> tuple:
+    """
+    Runs code through compile_cached and brainfuck_execute, in the shape of reference_run.
+
+    A program still running after timeout seconds is stopped and yields a
+    result that never matches the reference.
+    """
+    context = bf.BrainfuckExecutionContext(TAPE_SIZE)
+    output = bytearray()
+    stream = iter(data)
+
+    def read() -> str:
+        byte = next(stream, None)
+        return '' if byte is None else chr(byte)
+
+    def stop() -> None:
+        context.should_stop = True
+
+    context.output_handler = output.append
+    context.input_handler = read
+    watchdog = threading.Timer(timeout, stop)
+    watchdog.start()
+    try:
+        bf.brainfuck_execute(bf.compile_cached(code), context)
+    except bf.BrainfuckRuntimeError:
+        return bytes(output), None, False
+    finally:
+        watchdog.cancel()
+    if context.should_stop:
+        return bytes(output), "timed out", False
+    return bytes(output), bytes(context.tape), True
+
+def available_backends() -> list:
+    """Lists the backends that can run here."""
+    names = ["python"]
+    if importlib.util.find_spec("numba") is not None:
+        names.append("numba")
+    if bf.bf_core is not None:
+        names.append("bf_core")
+    return names
+
+def build_cases() -> list:
+    """Returns the fixed programs plus a seeded batch of random ones the reference can finish."""
+    rng = random.Random(1234)
+    cases = []
+    for code in PROGRAMS + [random_program(rng) for _ in range(400)]:
+        try:
+            cases.append((code, reference_run(code, INPUT)))
+        except StepLimitExceeded:
+            continue
+    return cases
+
+class BackendTest(unittest.TestCase):
+    """Compares every backend against reference_run."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.cases = build_cases()
+
+    def check_backend(self, name: str) -> None:
+        if name not in available_backends():
+            self.skipTest(f"{name} backend is not available")
+        with backend(name):
+            for code, expected in self.cases:
+                with self.subTest(code=code):
+                    self.assertEqual(run(code, INPUT), expected)
+            # should_stop must also end a loop that runs in native code.
+            self.assertEqual(run("+[]", b"", timeout=0.2)[1], "timed out")
+            if name == "numba":
+                # A failed kernel falls back silently to the interpreter.
+                self.assertTrue(bf._numba_available, "the Numba kernel failed to load")
+
+    def test_python(self) -> None:
+        self.check_backend("python")
+
+    def test_numba(self) -> None:
+        self.check_backend("numba")
+
+    def test_bf_core(self) -> None:
+        self.check_backend("bf_core")
+
+    def test_numba_failure_falls_back(self) -> None:
+        def broken_kernel() -> None:
+            raise ImportError("broken numba")
+
+        code = "+[+>+<]"
+        with backend("numba"), mock.patch.object(bf, "_load_numba_kernel", broken_kernel):
+            with self.assertWarns(RuntimeWarning):
+                self.assertEqual(run(code, b""), reference_run(code, b""))
+            # Later runs stay interpreted instead of retrying the import.
+            self.assertFalse(bf._numba_available)
+
+if __name__ == "__main__":
+    unittest.main()
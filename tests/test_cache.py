@@ -0,0 +1,116 @@
+"""
+Tests for the on-disk bytecode cache used by run_file.
+
+A cache hit is detected by planting the bytecode of a different program
+under a valid header: if run_file prints that program's output, it used the
+cache instead of compiling the source.
+"""
+
+import marshal
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from support import bf, captured_stdout
+
+# Prints 'A'.
+SOURCE = "++++++++[>++++++++<-]>+."
+
+# Prints 'Z' when run from a cache planted for SOURCE.
+PLANTED = "++++++++++[>+++++++++<-]>."
+
+class BytecodeCacheTest(unittest.TestCase):
+    """Exercises run_file against a temporary directory."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, "program.bf")
+        self.write_source(SOURCE)
+        # PYTHONDONTWRITEBYTECODE may be set in the environment running the tests.
+        patcher = mock.patch.object(sys, "dont_write_bytecode", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_source(self, code: str) -> None:
+        with open(self.filename, "w") as f:
+            f.write(code)
+
+    def run_file(self) -> bytes:
+        with captured_stdout() as out:
+            self.assertTrue(bf.run_file(self.filename))
+        return out.getvalue()
+
+    def cache_path(self) -> str:
+        return bf._bytecode_cache_path(self.filename)
+
+    def plant(self, code: str) -> None:
+        """Stores the bytecode of code as the cache of the current source."""
+        bf.store_cached_bytecode(self.filename, os.stat(self.filename), bf.compile_cached(code))
+
+    def test_first_run_writes_cache(self) -> None:
+        self.assertEqual(self.run_file(), b"A")
+        self.assertTrue(os.path.exists(self.cache_path()))
+
+    def test_hit_uses_cache(self) -> None:
+        self.plant(PLANTED)
+        self.assertEqual(self.run_file(), b"Z")
+
+    def test_mtime_change_is_a_miss(self) -> None:
+        self.plant(PLANTED)
+        stat = os.stat(self.filename)
+        os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self.run_file(), b"A")
+
+    def test_size_change_is_a_miss(self) -> None:
+        self.plant(PLANTED)
+        stat = os.stat(self.filename)
+        self.write_source(SOURCE + "+.")
+        # Same mtime as when the cache was written; only the size differs.
+        os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(self.run_file(), b"AB")
+
+    def test_version_bump_is_a_miss(self) -> None:
+        self.plant(PLANTED)
+        with mock.patch.object(bf, "BYTECODE_CACHE_VERSION", bf.BYTECODE_CACHE_VERSION + 1):
+            self.assertEqual(self.run_file(), b"A")
+
+    def test_miss_rewrites_cache(self) -> None:
+        self.plant(PLANTED)
+        with mock.patch.object(bf, "BYTECODE_CACHE_VERSION", bf.BYTECODE_CACHE_VERSION + 1):
+            self.run_file()
+            self.assertIsNotNone(bf.load_cached_bytecode(self.filename, os.stat(self.filename)))
+
+    def test_corrupt_cache_is_a_miss(self) -> None:
+        stat = os.stat(self.filename)
+        ops, args, aux = bf.compile_cached(PLANTED)
+        header = (bf.BYTECODE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        # A loop with output in it stays a real OP_JZ/OP_JNZ loop.
+        loop_ops, loop_args, loop_aux = bf.compile_cached("+++[>+.<-]")
+        bad_args = loop_args[:]
+        bad_args[loop_ops.index(bf.OP_JZ)] = 10 ** 6
+        payloads = {
+            "garbage": b"not a marshal stream",
+            "truncated": marshal.dumps(header + (ops.tobytes(), args.tobytes(), aux))[:-3],
+            "wrong types": marshal.dumps(header + (ops.tobytes(), 12345, aux)),
+            "length mismatch": marshal.dumps(header + (ops.tobytes(), args.tobytes()[:-4], aux)),
+            "unknown opcode": marshal.dumps(header + (b"\x7f" + ops.tobytes()[1:], args.tobytes(), aux)),
+            "jump out of range": marshal.dumps(header + (loop_ops.tobytes(), bad_args.tobytes(), loop_aux)),
+            "missing aux": marshal.dumps(header + (ops.tobytes(), args.tobytes(), [])),
+        }
+        os.makedirs(os.path.dirname(self.cache_path()), exist_ok=True)
+        for name, payload in payloads.items():
+            with self.subTest(name):
+                with open(self.cache_path(), "wb") as f:
+                    f.write(payload)
+                self.assertEqual(self.run_file(), b"A")
+
+    def test_dont_write_bytecode(self) -> None:
+        with mock.patch.object(sys, "dont_write_bytecode", True):
+            self.assertEqual(self.run_file(), b"A")
+        self.assertFalse(os.path.exists(self.cache_path()))
+
+if __name__ == "__main__":
+    unittest.main()
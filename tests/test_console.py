@@ -0,0 +1,42 @@
+"""
+Tests for the interactive console.
+"""
+
+import unittest
+from unittest import mock
+
+from support import bf, captured_stdout
+
+# A loop at the start of the code, which is dead only on an all-zero tape.
+LEADING_LOOP = "[.[-]]"
+
+def run_console(lines: list) -> bytes:
+    """Feeds lines to run_interactive_console, then Ctrl-D, and returns what it printed."""
+    with captured_stdout() as out, mock.patch("builtins.input", side_effect=lines + [EOFError()]):
+        bf.run_interactive_console()
+    return out.getvalue()
+
+class ConsoleTest(unittest.TestCase):
+    """Checks that console lines share one tape."""
+
+    def banner(self) -> bytes:
+        return (f"Brainfuck Interpreter v{bf.__version__} (Python)\n"
+                "Enter Brainfuck code (Ctrl-D to exit)\n").encode()
+
+    def test_tape_persists_between_lines(self) -> None:
+        output = run_console(["+" * 65, ">++<", LEADING_LOOP, ">."])
+        self.assertEqual(output, self.banner() + b"\n\nA\n\x02\n")
+
+    def test_error_keeps_tape(self) -> None:
+        with self.assertLogs(level="ERROR"):
+            output = run_console(["+" * 65, "[", LEADING_LOOP])
+        self.assertEqual(output, self.banner() + b"\n\nA\n")
+
+    def test_leading_loop_kept_without_fresh_tape(self) -> None:
+        fresh = bf.compile_cached(LEADING_LOOP)
+        kept = bf.compile_cached(LEADING_LOOP, fresh_tape=False)
+        self.assertNotIn(bf.OP_OUTPUT, fresh[0])
+        self.assertIn(bf.OP_OUTPUT, kept[0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for reading program input from piped (non-interactive) stdin.
+"""
+
+import io
+import unittest
+from unittest import mock
+
+from support import bf, captured_stdout
+
+# Includes newlines, a carriage return and a byte above 127.
+DATA = b"ab\ncd\r\n\n\xffz"
+
+class FakeStdin:
+    """A non-terminal stdin that counts how often its byte stream is read."""
+
+    def __init__(self, data: bytes) -> None:
+        self.buffer = io.BytesIO(data)
+        self.reads = 0
+        read = self.buffer.read
+
+        def counting_read(*args) -> bytes:
+            self.reads += 1
+            return read(*args)
+
+        self.buffer.read = counting_read
+
+    def isatty(self) -> bool:
+        return False
+
+class PipedInputTest(unittest.TestCase):
+    """Checks that piped stdin is read in one go and every byte reaches ','."""
+
+    def setUp(self) -> None:
+        self.stdin = FakeStdin(DATA)
+        patcher = mock.patch("sys.stdin", self.stdin)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_context_reads_buffered(self) -> None:
+        context = bf.BrainfuckExecutionContext(bf.TAPE_SIZE)
+        self.assertFalse(context.interactive_input)
+
+    def test_read_buffered_keeps_every_byte(self) -> None:
+        context = bf.BrainfuckExecutionContext(bf.TAPE_SIZE)
+        read = [bf.brainfuck_read_buffered(context) for _ in range(len(DATA))]
+        self.assertEqual("".join(read).encode("latin-1"), DATA)
+        self.assertEqual(bf.brainfuck_read_buffered(context), '')
+        self.assertEqual(bf.brainfuck_read_buffered(context), '')
+        self.assertEqual(self.stdin.reads, 1)
+
+    def test_cat_program(self) -> None:
+        context = bf.BrainfuckExecutionContext(bf.TAPE_SIZE)
+        with captured_stdout() as out:
+            bf.brainfuck_execute(bf.compile_cached(",[.,]"), context)
+        self.assertEqual(out.getvalue(), DATA)
+        self.assertEqual(self.stdin.reads, 1)
+
+    def test_eof_sets_cell_to_zero(self) -> None:
+        context = bf.BrainfuckExecutionContext(bf.TAPE_SIZE)
+        code = "," * len(DATA) + "+" + ","
+        with captured_stdout():
+            bf.brainfuck_execute(bf.compile_cached(code), context)
+        self.assertEqual(context.tape[0], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests for buffered program output and the '#' tape dump.
+"""
+
+import unittest
+
+from support import bf, captured_stdout
+
+class OutputFlushTest(unittest.TestCase):
+    """Checks when the default output handler's buffer reaches stdout."""
+
+    def run_until_input(self, code: str) -> tuple:
+        """
+        Runs code, recording how much output had reached stdout at its first ','.
+
+        Returns:
+            tuple: The bytes written by the time of the first read, and all of them.
+        """
+        context = bf.BrainfuckExecutionContext(bf.TAPE_SIZE)
+        context.interactive_input = False
+        seen = []
+        with captured_stdout() as out:
+            def read() -> str:
+                seen.append(len(out.getvalue()))
+                return ''
+
+            context.input_handler = read
+            bf.brainfuck_execute(bf.compile_cached(code), context)
+        return seen[0], out.getvalue()
+
+    def test_small_output_is_batched(self) -> None:
+        written, total = self.run_until_input("+" * 65 + "." * 10 + ",")
+        self.assertEqual(written, 0)
+        self.assertEqual(total, b"A" * 10)
+
+    def test_output_past_threshold_is_flushed_early(self) -> None:
+        count = bf.OUTPUT_FLUSH_THRESHOLD + 10
+        written, total = self.run_until_input("+" * 65 + "." * count + ",")
+        self.assertGreaterEqual(written, bf.OUTPUT_FLUSH_THRESHOLD)
+        self.assertEqual(total, b"A" * count)
+
+    def test_endless_output_is_flushed(self) -> None:
+        # '+[.]' never ends; the program is stopped once enough output has
+        # reached stdout, which only happens if the buffer is flushed early.
+        # It is also stopped after a few thresholds' worth, so a missing
+        # flush fails the test instead of hanging it.
+        context = bf.BrainfuckExecutionContext(bf.TAPE_SIZE)
+        produced = 0
+        with captured_stdout() as out:
+            def output(value: int) -> None:
+                nonlocal produced
+                produced += 1
+                context.out_buf.append(value)
+                if out.getvalue() or produced > 4 * bf.OUTPUT_FLUSH_THRESHOLD:
+                    context.should_stop = True
+
+            context.output_handler = output
+            bf.brainfuck_execute(bf.compile_cached("+[.]"), context)
+        self.assertLessEqual(produced, 4 * bf.OUTPUT_FLUSH_THRESHOLD)
+
+def expected_dump(tape: bytes, tape_index: int) -> bytes:
+    """Builds the three lines '#' prints, following the original formula."""
+    low = max(0, tape_index - 10)
+    high = min(len(tape), low + 21)
+    lines = [
+        "\t".join(str(i) for i in range(low, high)),
+        "\t".join(str(tape[i]) for i in range(low, high)),
+        "\t".join("^" if i == tape_index else " " for i in range(low, high)),
+    ]
+    return "".join(line + "\n" for line in lines).encode()
+
+class TapeDumpTest(unittest.TestCase):
+    """Checks the layout of the window printed by '#'."""
+
+    def dump(self, code: str, tape_size: int = bf.TAPE_SIZE) -> tuple:
+        """Runs code ending in '#' and returns its output and final context."""
+        context = bf.BrainfuckExecutionContext(tape_size)
+        with captured_stdout() as out:
+            bf.brainfuck_execute(bf.compile_cached(code), context)
+        return out.getvalue(), context
+
+    def test_start_of_tape(self) -> None:
+        output, context = self.dump("+>++>+++<#")
+        self.assertEqual(output, expected_dump(context.tape, 1))
+        self.assertEqual(output.splitlines()[2], b" \t^" + b"\t " * 19)
+
+    def test_middle_of_tape(self) -> None:
+        output, context = self.dump(">" * 30 + "+++>+<#")
+        self.assertEqual(output, expected_dump(context.tape, 30))
+        self.assertTrue(output.startswith(b"20\t21\t"))
+
+    def test_end_of_tape(self) -> None:
+        output, context = self.dump(">" * 15 + "+#", tape_size=16)
+        self.assertEqual(output, expected_dump(context.tape, 15))
+        self.assertTrue(output.splitlines()[2].endswith(b"\t^"))
+
+    def test_output_before_dump_comes_first(self) -> None:
+        output, context = self.dump("+" * 65 + ".#")
+        self.assertEqual(output, b"A" + expected_dump(context.tape, 0))
+
+if __name__ == "__main__":
+    unittest.main()